@@ -19,6 +19,7 @@ import os
 from copy import copy
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import (
     Alignment,
     Border,
@@ -28,13 +29,23 @@ from openpyxl.styles import (
     Side,
     numbers,
 )
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
+from openpyxl.workbook.properties import CalcProperties
+from openpyxl.worksheet.dimensions import ColumnDimension
 
 # ---------------------------------------------------------------------------
 # 0.  Workbook & style helpers
 # ---------------------------------------------------------------------------
 
-wb = Workbook()
+# Write-only mode streams each row to disk as it is appended, so every sheet
+# is emitted strictly top to bottom and all sheet-level settings (tab colour,
+# column widths, panes) must be in place before its first row.
+wb = Workbook(write_only=True)
+
+# openpyxl stores formulas without cached results, so the workbook must be
+# calculated when it is opened; manual mode would show blanks until F9.
+wb.calculation = CalcProperties(calcMode="auto", fullCalcOnLoad=True)
 
 # Colour palette
 DARK_BLUE = "1F3864"
@@ -54,10 +65,14 @@ section_fill = PatternFill(start_color=LIGHT_BLUE, end_color=LIGHT_BLUE, fill_ty
 input_font = Font(name="Calibri", size=11, color=MED_BLUE)
 total_font = Font(name="Calibri", bold=True, size=11)
 normal_font = Font(name="Calibri", size=11)
+title_font = Font(name="Calibri", bold=True, size=14, color=DARK_BLUE)
+subtitle_font = Font(name="Calibri", italic=True, size=10, color="666666")
 pct_fmt = '0.0%'
 num_fmt = '#,##0'
 num_fmt_1dp = '#,##0.0'
 acct_fmt = '#,##0;(#,##0);"-"'
+# Number format for a line's figures, by unit (anything else is a plain count)
+UNIT_FORMATS = {"%": pct_fmt, "A$m": acct_fmt}
 
 thin_border = Border(
     bottom=Side(style="thin", color="B4C6E7"),
@@ -71,40 +86,206 @@ double_bottom = Border(
 
 forecast_fill = PatternFill(start_color=FORECAST_BG, end_color=FORECAST_BG, fill_type="solid")
 
-
-def style_header_row(ws, row, max_col):
-    """Apply dark-blue header style to a row."""
-    for c in range(1, max_col + 1):
-        cell = ws.cell(row=row, column=c)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-
-def style_section_row(ws, row, max_col):
-    """Apply section header style."""
-    for c in range(1, max_col + 1):
-        cell = ws.cell(row=row, column=c)
-        cell.font = section_font
-        cell.fill = section_fill
-
-
-def apply_number_format(ws, row, col_start, col_end, fmt):
-    for c in range(col_start, col_end + 1):
-        ws.cell(row=row, column=c).number_format = fmt
-
-
-def mark_forecast_cols(ws, row, col_start, col_end):
-    """Lightly shade forecast columns."""
-    for c in range(col_start, col_end + 1):
-        cell = ws.cell(row=row, column=c)
-        if cell.fill == PatternFill() or cell.fill.start_color.index == "00000000":
-            cell.fill = forecast_fill
-
-
-def set_col_widths(ws, widths: dict):
-    for col_letter, w in widths.items():
-        ws.column_dimensions[col_letter].width = w
+# Named styles for the recurring font/fill combinations.  Assigning
+# ``cell.style`` copies the whole registered style in one step rather than
+# rebuilding the cell's style array attribute by attribute.
+wb.add_named_style(NamedStyle(name="HdrStyle", font=header_font, fill=header_fill,
+                              alignment=Alignment(horizontal="center", vertical="center")))
+wb.add_named_style(NamedStyle(name="SectionStyle", font=section_font, fill=section_fill))
+# Statement line styles (None = ordinary line) and their forecast-shaded forms
+_line_style_attrs = {
+    None: dict(font=DEFAULT_FONT),
+    "TotalStyle": dict(font=total_font, border=thick_bottom),
+    "CheckStyle": dict(font=total_font, border=double_bottom),
+    "ForecastStyle": dict(font=DEFAULT_FONT, fill=forecast_fill),
+    "TotalForecastStyle": dict(font=total_font, border=thick_bottom, fill=forecast_fill),
+    "CheckForecastStyle": dict(font=total_font, border=double_bottom, fill=forecast_fill),
+}
+# Shaded counterpart of each statement line style
+FORECAST_STYLES = {
+    None: "ForecastStyle",
+    "TotalStyle": "TotalForecastStyle",
+    "CheckStyle": "CheckForecastStyle",
+}
+# Suffix naming a line style's variant in each figure format (e.g. "TotalAcct")
+_FORMAT_SUFFIXES = {acct_fmt: "Acct", pct_fmt: "Pct", num_fmt: "Num"}
+_line_style_names = {}  # (line style, number format) -> registered style name
+
+
+def line_style_name(base, number_format=None):
+    """Name of line style ``base``, in ``number_format`` if given.
+
+    Each combination is registered the first time a cell asks for it, so the
+    workbook only carries named styles that are actually applied.
+    """
+    key = (base, number_format)
+    name = _line_style_names.get(key)
+    if name is None:
+        if number_format is None:
+            name = base
+            wb.add_named_style(NamedStyle(name=name, **_line_style_attrs[base]))
+        else:
+            name = (base or "").replace("Style", "") + _FORMAT_SUFFIXES[number_format]
+            wb.add_named_style(NamedStyle(name=name, number_format=number_format,
+                                          **_line_style_attrs[base]))
+        _line_style_names[key] = name
+    return name
+
+
+wb.add_named_style(NamedStyle(name="HistPct", font=normal_font, number_format=pct_fmt))
+wb.add_named_style(NamedStyle(name="HistNum", font=normal_font, number_format=num_fmt))
+wb.add_named_style(NamedStyle(name="InputForecastPct", font=input_font, fill=forecast_fill,
+                              number_format=pct_fmt))
+wb.add_named_style(NamedStyle(name="InputForecastNum", font=input_font, fill=forecast_fill,
+                              number_format=num_fmt))
+
+
+def styled_cell(ws, value=None, style=None, font=None, fill=None, border=None,
+                alignment=None, number_format=None):
+    """Create a write-only cell with a named style and/or style attributes."""
+    cell = WriteOnlyCell(ws, value=value)
+    if style is not None:
+        cell.style = style
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+def append_title_rows(ws, title, subtitle, title_alignment=None):
+    """Append the merged title and subtitle rows plus a spacer (rows 1-3)."""
+    last_cl = COL_LETTERS[MAX_COL]
+    ws.merged_cells.add(f"A1:{last_cl}1")
+    ws.merged_cells.add(f"A2:{last_cl}2")
+    ws.row_dimensions[1].height = 30
+    ws.append([styled_cell(ws, title, font=title_font, alignment=title_alignment)])
+    ws.append([styled_cell(ws, subtitle, font=subtitle_font)])
+    ws.append([])
+
+
+def style_header_row(ws, label, unit=None):
+    """Build the dark-blue header row of fiscal-year labels."""
+    return [styled_cell(ws, v, style="HdrStyle") for v in [label, unit] + FY_LABELS]
+
+
+def style_section_row(ws, label, unit=None):
+    """Build a section header row."""
+    # Spacer lines carry "" placeholders; leave those cells unwritten
+    values = [label or None, unit or None] + [None] * (MAX_COL - UNIT_COL)
+    return [styled_cell(ws, v, style="SectionStyle") for v in values]
+
+
+def assumption_row(ws, label, unit, vals, hist_style, fc_style):
+    """Build an Assumptions input row; each period takes a single named style."""
+    n_hist = FC_START - HIST_START
+    return ([label or None, unit or None]
+            + [None if v is None else styled_cell(ws, v, style=hist_style) for v in vals[:n_hist]]
+            + [None if v is None else styled_cell(ws, v, style=fc_style) for v in vals[n_hist:]])
+
+
+def pct_assumption_row(ws, label, unit, vals_pct):
+    """Assumptions row given in whole percentages (5.5 -> 5.5%)."""
+    scaled = [None if v is None else v / 100.0 for v in vals_pct]
+    return assumption_row(ws, label, unit, scaled, "HistPct", "InputForecastPct")
+
+
+def num_assumption_row(ws, label, unit, vals):
+    """Assumptions row of plain numbers (A$m, days, cents, securities)."""
+    return assumption_row(ws, label, unit, vals, "HistNum", "InputForecastNum")
+
+
+def item_row(ws, row, label, unit, hist, formulas, is_total=False,
+             total_style="TotalStyle", number_format=acct_fmt, template=None):
+    """Build a statement line: label, unit, historical values and formulas.
+
+    Forecast columns are lightly shaded as each cell is created.
+
+    ``formulas`` maps ``(row, col)`` to a value that overrides any
+    historical figure in that column.  ``template`` is the line's forecast
+    formula with ``{cl}`` / ``{prev}`` placeholders for the forecast and
+    prior-year column letters; it is expanded across FY26-FY30 here.
+    """
+    # Spacer lines carry "" placeholders; leave those cells unwritten
+    values = [label or None, unit or None] + [None] * (MAX_COL - UNIT_COL)
+    if hist is not None:
+        values[HIST_START - 1:HIST_START - 1 + len(hist)] = hist
+    if formulas:
+        for col in range(HIST_START, MAX_COL + 1):
+            formula = formulas.get((row, col))
+            if formula is not None:
+                values[col - 1] = formula
+    if template is not None:
+        for col in range(FC_START, FC_END + 1):
+            values[col - 1] = template.format(cl=COL_LETTERS[col], prev=COL_LETTERS[col - 1])
+
+    # Resolve the line's styles once; each cell then takes one of the two
+    line_style = total_style if is_total else None
+    forecast_style = FORECAST_STYLES[line_style]
+
+    cells = []
+    for col, v in enumerate(values, 1):
+        if col >= FC_START:
+            style = forecast_style
+        elif line_style is None and (v is None or col < HIST_START):
+            # Unstyled label/unit text (or an empty cell) goes in as the raw value
+            cells.append(v)
+            continue
+        else:
+            style = line_style
+        # Only cells carrying a figure get a number format, through the line
+        # style's variant in that format
+        if v is not None and col >= HIST_START:
+            style = line_style_name(style, number_format)
+        else:
+            style = line_style_name(style)
+        cells.append(styled_cell(ws, v, style=style))
+    return cells
+
+
+def statement_rows(ws, items, formulas=None, templates=None, start_row=5, check_label=None):
+    """Yield each statement line, top to bottom, as a fully built row.
+
+    ``items`` are ``(label, unit, hist, is_section, is_total)`` tuples and
+    ``templates`` maps a row to its forecast formula template, so historical
+    values, forecasts and styling are all attached in the one pass.  The
+    line labelled ``check_label`` takes the double-underlined check style.
+    """
+    templates = templates or {}
+    for row, (label, unit, hist, is_section, is_total) in enumerate(items, start_row):
+        if is_section:
+            yield style_section_row(ws, label, unit)
+        else:
+            yield item_row(ws, row, label, unit, hist, formulas, is_total,
+                           total_style="CheckStyle" if label == check_label else "TotalStyle",
+                           template=templates.get(row))
+
+
+def sum_template(rows):
+    """Formula template adding ``rows`` within one column, e.g. ``"={cl}5+{cl}6"``."""
+    return "=" + "+".join("{cl}%d" % r for r in rows)
+
+
+def sheet_refs(sheet_ref, row):
+    """``sheet_ref`` + cell reference to ``row`` for every year, keyed by column."""
+    return {col: f"{sheet_ref}{cl}{row}" for col, cl, _ in YEAR_COLS}
+
+
+def set_col_widths(ws, widths: dict, year_width=None):
+    dims = {col_letter: ColumnDimension(ws, index=col_letter, width=w)
+            for col_letter, w in widths.items()}
+    if year_width is not None:
+        # One <col min= max=> element spans all the FY columns
+        first = COL_LETTERS[HIST_START]
+        dims[first] = ColumnDimension(ws, index=first, min=HIST_START, max=MAX_COL,
+                                      width=year_width)
+    ws.column_dimensions.update(dims)
 
 
 # ---------------------------------------------------------------------------
@@ -118,34 +299,51 @@ FC_START = 8    # H  = FY26
 FC_END = 12     # L  = FY30
 MAX_COL = FC_END
 
+# Column letters indexed by column number (COL_LETTERS[3] == "C"); index 0 unused
+COL_LETTERS = ("",) + tuple(get_column_letter(i) for i in range(1, MAX_COL + 1))
+# (column, letter, prior-year letter) for each year FY21-FY30, for formula loops
+YEAR_COLS = tuple((col, COL_LETTERS[col], COL_LETTERS[col - 1])
+                  for col in range(HIST_START, MAX_COL + 1))
+HIST_YEAR_COLS = YEAR_COLS[:HIST_END - HIST_START + 1]
+FC_YEAR_COLS = YEAR_COLS[HIST_END - HIST_START + 1:]
+
 FY_LABELS = ["FY21", "FY22", "FY23", "FY24", "FY25",
              "FY26F", "FY27F", "FY28F", "FY29F", "FY30F"]
 
+# Sheets are created up front so the workbook keeps its tab order; each
+# section below then streams its rows into the matching sheet.
+ws_a = wb.create_sheet("Assumptions")
+ws_is = wb.create_sheet("Income Statement")
+ws_bs = wb.create_sheet("Balance Sheet")
+ws_cf = wb.create_sheet("Cash Flow Statement")
+ws_notes = wb.create_sheet("Notes")
+
+# Cross-sheet reference prefixes used in formulas
+ASM_REF = f"{ws_a.title}!"
+IS_REF = f"'{ws_is.title}'!"
+BS_REF = f"'{ws_bs.title}'!"
+CF_REF = f"'{ws_cf.title}'!"
+
+# Freeze panes and gridlines for each sheet
+for ws in (ws_a, ws_is, ws_bs, ws_cf, ws_notes):
+    ws.freeze_panes = "C5"
+    ws.sheet_view.showGridLines = False
+
 # ---------------------------------------------------------------------------
 # 1.  ASSUMPTIONS & DRIVERS  (Sheet 1)
 # ---------------------------------------------------------------------------
-ws_a = wb.active
-ws_a.title = "Assumptions"
 ws_a.sheet_properties.tabColor = MED_BLUE
 
-# Title
-ws_a.merge_cells("A1:L1")
-ws_a["A1"] = "Transurban Group (ASX: TCL) – Forecast Assumptions & Key Drivers"
-ws_a["A1"].font = Font(name="Calibri", bold=True, size=14, color=DARK_BLUE)
-ws_a["A1"].alignment = Alignment(horizontal="left", vertical="center")
-ws_a.row_dimensions[1].height = 30
+set_col_widths(ws_a, {"A": 36, "B": 10}, year_width=14)
 
-ws_a.merge_cells("A2:L2")
-ws_a["A2"] = "All figures in A$ millions unless otherwise stated.  Fiscal year ends 30 June."
-ws_a["A2"].font = Font(name="Calibri", italic=True, size=10, color="666666")
+# Title
+append_title_rows(ws_a,
+                  "Transurban Group (ASX: TCL) – Forecast Assumptions & Key Drivers",
+                  "All figures in A$ millions unless otherwise stated.  Fiscal year ends 30 June.",
+                  title_alignment=Alignment(horizontal="left", vertical="center"))
 
 # Column headers  (row 4)
-r = 4
-ws_a.cell(row=r, column=LABEL_COL, value="Assumption / Driver")
-ws_a.cell(row=r, column=UNIT_COL, value="Unit")
-for i, fy in enumerate(FY_LABELS):
-    ws_a.cell(row=r, column=HIST_START + i, value=fy)
-style_header_row(ws_a, r, MAX_COL)
+ws_a.append(style_header_row(ws_a, "Assumption / Driver", "Unit"))
 
 # ---- Revenue assumptions ----
 # Historical toll revenue growth (derived), forecast assumptions (input)
@@ -179,27 +377,13 @@ assumptions = [
     ("Net debt issuance / (repayment)", "A$m", [1_200, 2_050, 2_800, 600, 300, 400, 350, 300, 200, 100], False, False),
 ]
 
-r = 5
 for label, unit, vals, is_pct, is_section in assumptions:
-    ws_a.cell(row=r, column=LABEL_COL, value=label)
-    ws_a.cell(row=r, column=UNIT_COL, value=unit)
     if is_section:
-        style_section_row(ws_a, r, MAX_COL)
+        ws_a.append(style_section_row(ws_a, label, unit))
+    elif is_pct:
+        ws_a.append(pct_assumption_row(ws_a, label, unit, vals))
     else:
-        for i, v in enumerate(vals):
-            col = HIST_START + i
-            cell = ws_a.cell(row=r, column=col)
-            if v is not None:
-                if is_pct:
-                    cell.value = v / 100.0
-                    cell.number_format = pct_fmt
-                else:
-                    cell.value = v
-                    cell.number_format = num_fmt
-                cell.font = input_font if col >= FC_START else normal_font
-                if col >= FC_START:
-                    cell.fill = forecast_fill
-    r += 1
+        ws_a.append(num_assumption_row(ws_a, label, unit, vals))
 
 # Store assumption rows for referencing from other sheets
 # We'll just hard-code the references since we know the layout.
@@ -217,51 +401,48 @@ AROW_DPS = 26       # DPS
 AROW_SHARES = 27    # Shares on issue
 AROW_NET_DEBT = 28  # Net debt issuance
 
-set_col_widths(ws_a, {"A": 36, "B": 10})
-for i in range(HIST_START, MAX_COL + 1):
-    ws_a.column_dimensions[get_column_letter(i)].width = 14
-
 # ---------------------------------------------------------------------------
 # 2.  INCOME STATEMENT  (Sheet 2)
 # ---------------------------------------------------------------------------
-ws_is = wb.create_sheet("Income Statement")
 ws_is.sheet_properties.tabColor = "4472C4"
 
-ws_is.merge_cells("A1:L1")
-ws_is["A1"] = "Transurban Group – Income Statement"
-ws_is["A1"].font = Font(name="Calibri", bold=True, size=14, color=DARK_BLUE)
-ws_is.row_dimensions[1].height = 30
+set_col_widths(ws_is, {"A": 36, "B": 10}, year_width=15)
 
-ws_is.merge_cells("A2:L2")
-ws_is["A2"] = "A$ millions  |  Fiscal year ends 30 June"
-ws_is["A2"].font = Font(name="Calibri", italic=True, size=10, color="666666")
+append_title_rows(ws_is, "Transurban Group – Income Statement",
+                  "A$ millions  |  Fiscal year ends 30 June")
 
 # Header row (row 4)
-r = 4
-ws_is.cell(row=r, column=LABEL_COL, value="Income Statement")
-ws_is.cell(row=r, column=UNIT_COL, value="")
-for i, fy in enumerate(FY_LABELS):
-    ws_is.cell(row=r, column=HIST_START + i, value=fy)
-style_header_row(ws_is, r, MAX_COL)
+ws_is.append(style_header_row(ws_is, "Income Statement", ""))
 
 # Historical data  (FY21-FY25)
 hist_toll_rev = [2_459, 2_830, 3_455, 3_756, 3_990]
 hist_other_rev = [319, 311, 332, 326, 360]
-hist_total_rev = [t + o for t, o in zip(hist_toll_rev, hist_other_rev)]  # derived
 
 hist_employee = [-236, -251, -280, -298, -313]
 hist_road_ops = [-340, -333, -380, -395, -418]
 hist_corp_admin = [-401, -436, -535, -562, -608]
-hist_total_opex = [e + ro + ca for e, ro, ca in zip(hist_employee, hist_road_ops, hist_corp_admin)]
 
-hist_ebitda = [tr + ox for tr, ox in zip(hist_total_rev, hist_total_opex)]
 hist_da = [-856, -880, -905, -930, -958]
-hist_ebit = [eb + da for eb, da in zip(hist_ebitda, hist_da)]
-
 hist_net_finance = [-907, -821, -963, -1_093, -1_150]
-hist_pbt = [eb + nf for eb, nf in zip(hist_ebit, hist_net_finance)]
 hist_tax = [7, -141, -270, -249, -282]
-hist_npat = [pb + tx for pb, tx in zip(hist_pbt, hist_tax)]
+
+# Derived subtotals, built in a single pass over the five historical years
+hist_total_rev, hist_total_opex, hist_ebitda = [], [], []
+hist_ebit, hist_pbt, hist_npat = [], [], []
+for tr, orv, emp, road, corp, da, nfc, tax in zip(
+        hist_toll_rev, hist_other_rev, hist_employee, hist_road_ops,
+        hist_corp_admin, hist_da, hist_net_finance, hist_tax):
+    trev = tr + orv
+    topex = emp + road + corp
+    ebitda = trev + topex
+    ebit = ebitda + da
+    pbt = ebit + nfc
+    hist_total_rev.append(trev)
+    hist_total_opex.append(topex)
+    hist_ebitda.append(ebitda)
+    hist_ebit.append(ebit)
+    hist_pbt.append(pbt)
+    hist_npat.append(pbt + tax)
 
 # Row map for IS  (starting at row 5)
 IS_START = 5
@@ -288,32 +469,11 @@ is_items = [
     ("Net Profit / (Loss) After Tax", "A$m", hist_npat, False, True),
 ]
 
-# Absolute row numbers  (for cross-referencing)
-IS_ROW = {}  # name -> absolute row
+# Absolute row numbers  (for cross-referencing).  Rows are streamed top to
+# bottom, so every position is fixed from the item list before any writes.
+IS_ROW = {label: IS_START + i for i, (label, *_) in enumerate(is_items) if label}
 
-r = IS_START
-for label, unit, hist, is_section, is_total in is_items:
-    ws_is.cell(row=r, column=LABEL_COL, value=label)
-    if unit:
-        ws_is.cell(row=r, column=UNIT_COL, value=unit)
-    IS_ROW[label] = r
-
-    if is_section:
-        style_section_row(ws_is, r, MAX_COL)
-    elif is_total:
-        for c in range(1, MAX_COL + 1):
-            ws_is.cell(row=r, column=c).font = total_font
-            ws_is.cell(row=r, column=c).border = thick_bottom
-
-    # Write historical values
-    if hist is not None:
-        for i, v in enumerate(hist):
-            col = HIST_START + i
-            ws_is.cell(row=r, column=col, value=v).number_format = acct_fmt
-
-    r += 1
-
-# Pre-compute BS and CF row positions from label lists.
+# Pre-compute the BS and CF row maps from label lists.
 # This avoids hard-coding row numbers for cross-sheet references.
 # The labels must match exactly those used when building each sheet.
 _bs_labels = [
@@ -332,9 +492,9 @@ _bs_labels = [
     "Reserves", "Total Equity", "", "Total Liabilities & Equity",
     "", "Balance Sheet Check (Assets - L&E)",
 ]
-_bs_row_map = {lbl: 5 + i for i, lbl in enumerate(_bs_labels)}
-BS_NCA_ROW = _bs_row_map["Total Non-Current Assets"]
-BS_DEBT_ROW = _bs_row_map["Total Borrowings (current + non-current)"]
+BS_ROW = {lbl: 5 + i for i, lbl in enumerate(_bs_labels) if lbl}
+BS_NCA_ROW = BS_ROW["Total Non-Current Assets"]
+BS_DEBT_ROW = BS_ROW["Total Borrowings (current + non-current)"]
 
 _cf_labels = [
     "OPERATING ACTIVITIES", "Net profit / (loss) after tax", "Add back: D&A",
@@ -348,159 +508,124 @@ _cf_labels = [
     "Net increase / (decrease) in cash", "FX & other adjustments",
     "Opening cash balance", "Closing Cash Balance",
 ]
-_cf_row_map = {lbl: 5 + i for i, lbl in enumerate(_cf_labels)}
-CF_CLOSE_CASH_ROW = _cf_row_map["Closing Cash Balance"]
+CF_ROW = {lbl: 5 + i for i, lbl in enumerate(_cf_labels) if lbl}
+CF_CLOSE_CASH_ROW = CF_ROW["Closing Cash Balance"]
 
 # -- Forecast formulas (FY26-FY30) --
-# Toll revenue: prior year * (1 + toll growth assumption)
-for fc_idx in range(5):
-    col = FC_START + fc_idx
-    prev_col_letter = get_column_letter(col - 1)
-    assum_col_letter = get_column_letter(col)
-
-    # Toll revenue  (row IS_ROW["Toll revenue"])
-    row_tr = IS_ROW["Toll revenue"]
-    formula = f"={prev_col_letter}{row_tr}*(1+Assumptions!{assum_col_letter}{AROW_TOLL_GR})"
-    ws_is.cell(row=row_tr, column=col, value=formula).number_format = acct_fmt
-
+row_tr = IS_ROW["Toll revenue"]
+row_or = IS_ROW["Other revenue"]
+row_trev = IS_ROW["Total Revenue"]
+row_emp = IS_ROW["Employee costs"]
+row_road = IS_ROW["Road operating costs"]
+row_corp = IS_ROW["Corporate & admin costs"]
+row_topex = IS_ROW["Total Operating Expenses"]
+row_ebitda = IS_ROW["EBITDA"]
+row_da = IS_ROW["Depreciation & amortisation"]
+row_ebit = IS_ROW["EBIT"]
+row_nfc = IS_ROW["Net finance costs"]
+row_pbt = IS_ROW["Profit / (Loss) before tax"]
+row_tax = IS_ROW["Income tax (expense) / benefit"]
+row_npat = IS_ROW["Net Profit / (Loss) After Tax"]
+
+# Row numbers are fixed, so each formula is a template over the column
+# letters only: {cl} is the forecast column, {prev} the prior year.
+is_templates = {
+    # Toll revenue: prior year * (1 + toll growth assumption)
+    row_tr: "={prev}%d*(1+%s{cl}%d)" % (row_tr, ASM_REF, AROW_TOLL_GR),
     # Other revenue
-    row_or = IS_ROW["Other revenue"]
-    formula = f"={prev_col_letter}{row_or}*(1+Assumptions!{assum_col_letter}{AROW_OTHER_GR})"
-    ws_is.cell(row=row_or, column=col, value=formula).number_format = acct_fmt
-
+    row_or: "={prev}%d*(1+%s{cl}%d)" % (row_or, ASM_REF, AROW_OTHER_GR),
     # Total Revenue = Toll + Other
-    row_trev = IS_ROW["Total Revenue"]
-    formula = f"={get_column_letter(col)}{row_tr}+{get_column_letter(col)}{row_or}"
-    ws_is.cell(row=row_trev, column=col, value=formula).number_format = acct_fmt
-
-    # Operating expenses: total opex = revenue * opex%
-    # We'll compute total opex first, then split into sub-items proportionally
-    row_emp = IS_ROW["Employee costs"]
-    row_road = IS_ROW["Road operating costs"]
-    row_corp = IS_ROW["Corporate & admin costs"]
-    row_topex = IS_ROW["Total Operating Expenses"]
-    cl = get_column_letter(col)
-
+    row_trev: "={cl}%d+{cl}%d" % (row_tr, row_or),
+    # Operating expenses: total opex = revenue * opex%, split into sub-items
     # Employee costs = revenue * employee cost %
-    formula = f"=-{cl}{row_trev}*Assumptions!{cl}{AROW_OPEX_PCT}*0.25"
-    ws_is.cell(row=row_emp, column=col, value=formula).number_format = acct_fmt
-
+    row_emp: "=-{cl}%d*%s{cl}%d*0.25" % (row_trev, ASM_REF, AROW_OPEX_PCT),
     # Road operating costs ≈ 33% of total opex
-    formula = f"=-{cl}{row_trev}*Assumptions!{cl}{AROW_OPEX_PCT}*0.33"
-    ws_is.cell(row=row_road, column=col, value=formula).number_format = acct_fmt
-
+    row_road: "=-{cl}%d*%s{cl}%d*0.33" % (row_trev, ASM_REF, AROW_OPEX_PCT),
     # Corporate & admin = remainder  (opex% * rev) - employee - road ops
-    formula = f"=-{cl}{row_trev}*Assumptions!{cl}{AROW_OPEX_PCT}-{cl}{row_emp}-{cl}{row_road}"
-    ws_is.cell(row=row_corp, column=col, value=formula).number_format = acct_fmt
-
+    row_corp: "=-{cl}%d*%s{cl}%d-{cl}%d-{cl}%d" % (row_trev, ASM_REF, AROW_OPEX_PCT, row_emp, row_road),
     # Total operating expenses
-    formula = f"={cl}{row_emp}+{cl}{row_road}+{cl}{row_corp}"
-    ws_is.cell(row=row_topex, column=col, value=formula).number_format = acct_fmt
-
+    row_topex: "={cl}%d+{cl}%d+{cl}%d" % (row_emp, row_road, row_corp),
     # EBITDA
-    row_ebitda = IS_ROW["EBITDA"]
-    formula = f"={cl}{row_trev}+{cl}{row_topex}"
-    ws_is.cell(row=row_ebitda, column=col, value=formula).number_format = acct_fmt
-
+    row_ebitda: "={cl}%d+{cl}%d" % (row_trev, row_topex),
     # D&A  (linked to BS non-current assets via assumption %)
     # D&A = -(opening NCA * D&A %)  -- opening NCA is prior year's closing NCA
-    row_da = IS_ROW["Depreciation & amortisation"]
-    prev_cl = get_column_letter(col - 1)
-    formula = f"=-'Balance Sheet'!{prev_cl}{BS_NCA_ROW}*Assumptions!{cl}{AROW_DA_PCT}"
-    ws_is.cell(row=row_da, column=col, value=formula).number_format = acct_fmt
-
+    row_da: "=-%s{prev}%d*%s{cl}%d" % (BS_REF, BS_NCA_ROW, ASM_REF, AROW_DA_PCT),
     # EBIT
-    row_ebit = IS_ROW["EBIT"]
-    formula = f"={cl}{row_ebitda}+{cl}{row_da}"
-    ws_is.cell(row=row_ebit, column=col, value=formula).number_format = acct_fmt
-
+    row_ebit: "={cl}%d+{cl}%d" % (row_ebitda, row_da),
     # Net finance costs = -(avg debt * cost of debt)
     # Use opening debt to avoid circular reference
-    row_nfc = IS_ROW["Net finance costs"]
-    formula = f"=-'Balance Sheet'!{prev_cl}{BS_DEBT_ROW}*Assumptions!{cl}{AROW_COD}"
-    ws_is.cell(row=row_nfc, column=col, value=formula).number_format = acct_fmt
-
+    row_nfc: "=-%s{prev}%d*%s{cl}%d" % (BS_REF, BS_DEBT_ROW, ASM_REF, AROW_COD),
     # PBT
-    row_pbt = IS_ROW["Profit / (Loss) before tax"]
-    formula = f"={cl}{row_ebit}+{cl}{row_nfc}"
-    ws_is.cell(row=row_pbt, column=col, value=formula).number_format = acct_fmt
-
+    row_pbt: "={cl}%d+{cl}%d" % (row_ebit, row_nfc),
     # Tax
-    row_tax = IS_ROW["Income tax (expense) / benefit"]
-    formula = f"=-{cl}{row_pbt}*Assumptions!{cl}{AROW_TAX}"
-    ws_is.cell(row=row_tax, column=col, value=formula).number_format = acct_fmt
-
+    row_tax: "=-{cl}%d*%s{cl}%d" % (row_pbt, ASM_REF, AROW_TAX),
     # NPAT
-    row_npat = IS_ROW["Net Profit / (Loss) After Tax"]
-    formula = f"={cl}{row_pbt}+{cl}{row_tax}"
-    ws_is.cell(row=row_npat, column=col, value=formula).number_format = acct_fmt
-
-    # Shade forecast columns
-    for rr in range(IS_START, r):
-        mark_forecast_cols(ws_is, rr, col, col)
+    row_npat: "={cl}%d+{cl}%d" % (row_pbt, row_tax),
+}
 
-set_col_widths(ws_is, {"A": 36, "B": 10})
-for i in range(HIST_START, MAX_COL + 1):
-    ws_is.column_dimensions[get_column_letter(i)].width = 15
+# Templates are expanded across FY26-FY30 as each line is built
+for row in statement_rows(ws_is, is_items, templates=is_templates, start_row=IS_START):
+    ws_is.append(row)
 
 # ---------------------------------------------------------------------------
 # 3.  BALANCE SHEET  (Sheet 3)
 # ---------------------------------------------------------------------------
-ws_bs = wb.create_sheet("Balance Sheet")
 ws_bs.sheet_properties.tabColor = "548235"
 
-ws_bs.merge_cells("A1:L1")
-ws_bs["A1"] = "Transurban Group – Balance Sheet"
-ws_bs["A1"].font = Font(name="Calibri", bold=True, size=14, color=DARK_BLUE)
-ws_bs.row_dimensions[1].height = 30
+set_col_widths(ws_bs, {"A": 40, "B": 10}, year_width=15)
 
-ws_bs.merge_cells("A2:L2")
-ws_bs["A2"] = "A$ millions  |  As at 30 June"
-ws_bs["A2"].font = Font(name="Calibri", italic=True, size=10, color="666666")
+append_title_rows(ws_bs, "Transurban Group – Balance Sheet",
+                  "A$ millions  |  As at 30 June")
 
-r = 4
-ws_bs.cell(row=r, column=LABEL_COL, value="Balance Sheet")
-for i, fy in enumerate(FY_LABELS):
-    ws_bs.cell(row=r, column=HIST_START + i, value=fy)
-style_header_row(ws_bs, r, MAX_COL)
+ws_bs.append(style_header_row(ws_bs, "Balance Sheet"))
 
 # Historical balance sheet data (A$m, approximate)
 hist_cash = [2_548, 3_145, 2_780, 2_350, 2_520]
 hist_recv = [213, 224, 260, 269, 286]
 hist_other_ca = [195, 210, 225, 230, 240]
-hist_total_ca = [c + rc + o for c, rc, o in zip(hist_cash, hist_recv, hist_other_ca)]
 
 hist_ppe = [6_125, 6_850, 7_900, 8_100, 8_050]
 hist_intangibles = [22_450, 23_100, 24_200, 24_650, 24_800]
 hist_invest_jv = [1_820, 1_750, 1_680, 1_620, 1_580]
 hist_other_nca = [1_250, 1_380, 1_520, 1_580, 1_620]
-hist_total_nca = [p + ig + j + o for p, ig, j, o in
-                  zip(hist_ppe, hist_intangibles, hist_invest_jv, hist_other_nca)]
-
-hist_total_assets = [ca + nca for ca, nca in zip(hist_total_ca, hist_total_nca)]
 
 hist_payables = [485, 510, 555, 530, 550]
 hist_current_debt = [1_250, 1_400, 1_600, 1_300, 1_200]
 hist_other_cl = [580, 620, 680, 710, 740]
-hist_total_cl = [p + d + o for p, d, o in zip(hist_payables, hist_current_debt, hist_other_cl)]
 
 hist_nc_debt = [19_580, 21_230, 23_430, 23_730, 23_830]
-hist_total_borrow = [cd + nd for cd, nd in zip(hist_current_debt, hist_nc_debt)]
 hist_other_ncl = [2_350, 2_480, 2_620, 2_700, 2_780]
-hist_total_ncl = [d + o for d, o in zip(hist_nc_debt, hist_other_ncl)]
-
-hist_total_liab = [cl + ncl for cl, ncl in zip(hist_total_cl, hist_total_ncl)]
 
 hist_share_cap = [13_845, 14_250, 14_680, 15_020, 15_310]
 hist_reserves = [358, 380, 380, 400, 412]
-# Retained earnings is the balancing plug so that Assets = L&E exactly
-hist_retained = [
-    ta - tl - sc - rs
-    for ta, tl, sc, rs in zip(hist_total_assets, hist_total_liab, hist_share_cap, hist_reserves)
-]
-hist_total_eq = [s + re + rs for s, re, rs in zip(hist_share_cap, hist_retained, hist_reserves)]
 
-hist_total_le = [tl + te for tl, te in zip(hist_total_liab, hist_total_eq)]
+# Derived subtotals, built in a single pass over the five historical years.
+# Retained earnings is the balancing plug so that Assets = L&E exactly.
+hist_total_ca, hist_total_nca, hist_total_assets = [], [], []
+hist_total_cl, hist_total_borrow, hist_total_ncl, hist_total_liab = [], [], [], []
+hist_retained, hist_total_eq, hist_total_le = [], [], []
+for cash, recv, oca, ppe, intang, jv, onca, pay, cd, ocl, ncd, oncl, sc, rsv in zip(
+        hist_cash, hist_recv, hist_other_ca, hist_ppe, hist_intangibles,
+        hist_invest_jv, hist_other_nca, hist_payables, hist_current_debt,
+        hist_other_cl, hist_nc_debt, hist_other_ncl, hist_share_cap, hist_reserves):
+    tca = cash + recv + oca
+    tnca = ppe + intang + jv + onca
+    ta = tca + tnca
+    tcl = pay + cd + ocl
+    tncl = ncd + oncl
+    tl = tcl + tncl
+    re = ta - tl - sc - rsv
+    teq = sc + re + rsv
+    hist_total_ca.append(tca)
+    hist_total_nca.append(tnca)
+    hist_total_assets.append(ta)
+    hist_total_cl.append(tcl)
+    hist_total_borrow.append(cd + ncd)
+    hist_total_ncl.append(tncl)
+    hist_total_liab.append(tl)
+    hist_retained.append(re)
+    hist_total_eq.append(teq)
+    hist_total_le.append(tl + teq)
 
 bs_items = [
     ("ASSETS", None, None, True, False),
@@ -545,41 +670,16 @@ bs_items = [
     ("Balance Sheet Check (Assets - L&E)", "A$m", None, False, True),
 ]
 
-BS_ROW = {}
-r = 5
-for label, unit, hist, is_section, is_total in bs_items:
-    ws_bs.cell(row=r, column=LABEL_COL, value=label)
-    if unit:
-        ws_bs.cell(row=r, column=UNIT_COL, value=unit)
-    BS_ROW[label] = r
-
-    if is_section:
-        style_section_row(ws_bs, r, MAX_COL)
-    elif is_total:
-        for c in range(1, MAX_COL + 1):
-            ws_bs.cell(row=r, column=c).font = total_font
-            ws_bs.cell(row=r, column=c).border = thick_bottom if label != "Balance Sheet Check (Assets - L&E)" else double_bottom
-
-    if hist is not None:
-        for i, v in enumerate(hist):
-            ws_bs.cell(row=r, column=HIST_START + i, value=v).number_format = acct_fmt
-
-    r += 1
-
-# Verify pre-computed row positions match actual
-actual_bs_nca_row = BS_ROW["Total Non-Current Assets"]
-actual_bs_debt_row = BS_ROW["Total Borrowings (current + non-current)"]
-assert actual_bs_nca_row == BS_NCA_ROW, f"BS NCA row mismatch: {actual_bs_nca_row} != {BS_NCA_ROW}"
-assert actual_bs_debt_row == BS_DEBT_ROW, f"BS debt row mismatch: {actual_bs_debt_row} != {BS_DEBT_ROW}"
+# Verify the pre-computed row positions match the item list (before any writes)
+assert [label for label, *_ in bs_items] == _bs_labels, "BS item list does not match _bs_labels"
 
 # Now write BS check formulas for historical
+bs_formulas = {}  # (row, col) -> formula
 row_ta = BS_ROW["Total Assets"]
 row_tle = BS_ROW["Total Liabilities & Equity"]
 row_check = BS_ROW["Balance Sheet Check (Assets - L&E)"]
-for col in range(HIST_START, HIST_END + 1):
-    cl = get_column_letter(col)
-    ws_bs.cell(row=row_check, column=col,
-               value=f"={cl}{row_ta}-{cl}{row_tle}").number_format = acct_fmt
+for col, cl, _ in HIST_YEAR_COLS:
+    bs_formulas[row_check, col] = f"={cl}{row_ta}-{cl}{row_tle}"
 
 # ---- FORECAST FORMULAS FOR BALANCE SHEET (FY26-FY30) ----
 row_cash = BS_ROW["Cash & cash equivalents"]
@@ -611,171 +711,115 @@ row_tle = BS_ROW["Total Liabilities & Equity"]
 IS_ROW_NPAT = IS_ROW["Net Profit / (Loss) After Tax"]
 IS_ROW_DA = IS_ROW["Depreciation & amortisation"]
 IS_ROW_TREV = IS_ROW["Total Revenue"]
+IS_ROW_TOPEX = IS_ROW["Total Operating Expenses"]
 
-for fc_idx in range(5):
-    col = FC_START + fc_idx
-    cl = get_column_letter(col)
-    prev_cl = get_column_letter(col - 1)
-
+bs_templates = {
     # -- ASSETS --
     # Cash comes from Cash Flow Statement (closing cash)
-    ws_bs.cell(row=row_cash, column=col,
-               value=f"='Cash Flow Statement'!{cl}{CF_CLOSE_CASH_ROW}").number_format = acct_fmt
-
+    row_cash: "=%s{cl}%d" % (CF_REF, CF_CLOSE_CASH_ROW),
     # Trade receivables = (Revenue / 365) * receivable days
-    ws_bs.cell(row=row_recv, column=col,
-               value=f"='Income Statement'!{cl}{IS_ROW_TREV}/365*Assumptions!{cl}{AROW_REC_DAYS}").number_format = acct_fmt
-
+    row_recv: "=%s{cl}%d/365*%s{cl}%d" % (IS_REF, IS_ROW_TREV, ASM_REF, AROW_REC_DAYS),
     # Other current assets: grow at 3% p.a.
-    ws_bs.cell(row=row_oca, column=col,
-               value=f"={prev_cl}{row_oca}*1.03").number_format = acct_fmt
-
+    row_oca: "={prev}%d*1.03" % (row_oca,),
     # Total CA
-    ws_bs.cell(row=row_tca, column=col,
-               value=f"={cl}{row_cash}+{cl}{row_recv}+{cl}{row_oca}").number_format = acct_fmt
-
+    row_tca: "={cl}%d+{cl}%d+{cl}%d" % (row_cash, row_recv, row_oca),
     # PP&E = prior PP&E + capex + D&A (D&A is negative, so adding reduces)
-    ws_bs.cell(row=row_ppe, column=col,
-               value=f"={prev_cl}{row_ppe}+Assumptions!{cl}{AROW_CAPEX}+'Income Statement'!{cl}{IS_ROW_DA}*0.40").number_format = acct_fmt
-
+    row_ppe: "={prev}%d+%s{cl}%d+%s{cl}%d*0.40" % (row_ppe, ASM_REF, AROW_CAPEX, IS_REF, IS_ROW_DA),
     # Intangibles = prior - amortisation (60% of D&A allocated to intangibles)
-    ws_bs.cell(row=row_intang, column=col,
-               value=f"={prev_cl}{row_intang}+'Income Statement'!{cl}{IS_ROW_DA}*0.60").number_format = acct_fmt
-
+    row_intang: "={prev}%d+%s{cl}%d*0.60" % (row_intang, IS_REF, IS_ROW_DA),
     # JV investments: stable, slight decline
-    ws_bs.cell(row=row_jv, column=col,
-               value=f"={prev_cl}{row_jv}*0.98").number_format = acct_fmt
-
+    row_jv: "={prev}%d*0.98" % (row_jv,),
     # Other NCA: grow at 2%
-    ws_bs.cell(row=row_onca, column=col,
-               value=f"={prev_cl}{row_onca}*1.02").number_format = acct_fmt
-
+    row_onca: "={prev}%d*1.02" % (row_onca,),
     # Total NCA
-    ws_bs.cell(row=row_tnca, column=col,
-               value=f"={cl}{row_ppe}+{cl}{row_intang}+{cl}{row_jv}+{cl}{row_onca}").number_format = acct_fmt
-
+    row_tnca: "={cl}%d+{cl}%d+{cl}%d+{cl}%d" % (row_ppe, row_intang, row_jv, row_onca),
     # Total Assets
-    ws_bs.cell(row=row_ta, column=col,
-               value=f"={cl}{row_tca}+{cl}{row_tnca}").number_format = acct_fmt
-
+    row_ta: "={cl}%d+{cl}%d" % (row_tca, row_tnca),
     # -- LIABILITIES --
     # Trade payables = (Total opex / 365) * payable days
-    IS_ROW_TOPEX = IS_ROW["Total Operating Expenses"]
-    ws_bs.cell(row=row_pay, column=col,
-               value=f"=-'Income Statement'!{cl}{IS_ROW_TOPEX}/365*Assumptions!{cl}{AROW_PAY_DAYS}").number_format = acct_fmt
-
+    row_pay: "=-%s{cl}%d/365*%s{cl}%d" % (IS_REF, IS_ROW_TOPEX, ASM_REF, AROW_PAY_DAYS),
     # Current borrowings: assume stable proportion (~5% of total debt)
-    ws_bs.cell(row=row_cd, column=col,
-               value=f"=({prev_cl}{row_tb}+Assumptions!{cl}{AROW_NET_DEBT})*0.05").number_format = acct_fmt
-
+    row_cd: "=({prev}%d+%s{cl}%d)*0.05" % (row_tb, ASM_REF, AROW_NET_DEBT),
     # Other current liabilities: grow at 3%
-    ws_bs.cell(row=row_ocl, column=col,
-               value=f"={prev_cl}{row_ocl}*1.03").number_format = acct_fmt
-
+    row_ocl: "={prev}%d*1.03" % (row_ocl,),
     # Total CL
-    ws_bs.cell(row=row_tcl, column=col,
-               value=f"={cl}{row_pay}+{cl}{row_cd}+{cl}{row_ocl}").number_format = acct_fmt
-
+    row_tcl: "={cl}%d+{cl}%d+{cl}%d" % (row_pay, row_cd, row_ocl),
     # Non-current borrowings = prior total debt + net debt issuance - current borrowings
-    ws_bs.cell(row=row_ncd, column=col,
-               value=f"={prev_cl}{row_tb}+Assumptions!{cl}{AROW_NET_DEBT}-{cl}{row_cd}").number_format = acct_fmt
-
+    row_ncd: "={prev}%d+%s{cl}%d-{cl}%d" % (row_tb, ASM_REF, AROW_NET_DEBT, row_cd),
     # Other NCL: grow at 2%
-    ws_bs.cell(row=row_oncl, column=col,
-               value=f"={prev_cl}{row_oncl}*1.02").number_format = acct_fmt
-
+    row_oncl: "={prev}%d*1.02" % (row_oncl,),
     # Total NCL
-    ws_bs.cell(row=row_tncl, column=col,
-               value=f"={cl}{row_ncd}+{cl}{row_oncl}").number_format = acct_fmt
-
+    row_tncl: "={cl}%d+{cl}%d" % (row_ncd, row_oncl),
     # Total Borrowings
-    ws_bs.cell(row=row_tb, column=col,
-               value=f"={cl}{row_cd}+{cl}{row_ncd}").number_format = acct_fmt
-
+    row_tb: "={cl}%d+{cl}%d" % (row_cd, row_ncd),
     # Total Liabilities
-    ws_bs.cell(row=row_tl, column=col,
-               value=f"={cl}{row_tcl}+{cl}{row_tncl}").number_format = acct_fmt
-
+    row_tl: "={cl}%d+{cl}%d" % (row_tcl, row_tncl),
     # -- EQUITY --
     # Share capital: prior + assumed equity raise (DRP ~1% dilution)
-    ws_bs.cell(row=row_sc, column=col,
-               value=f"={prev_cl}{row_sc}*(1+0.01)").number_format = acct_fmt
-
+    row_sc: "={prev}%d*(1+0.01)" % (row_sc,),
     # Retained earnings = prior RE + NPAT - dividends paid
     # Dividends = DPS * shares / 100 (DPS in cents)
-    ws_bs.cell(row=row_re, column=col,
-               value=f"={prev_cl}{row_re}+'Income Statement'!{cl}{IS_ROW_NPAT}-Assumptions!{cl}{AROW_DPS}*Assumptions!{cl}{AROW_SHARES}/100").number_format = acct_fmt
-
+    row_re: "={prev}%d+%s{cl}%d-%s{cl}%d*%s{cl}%d/100" % (row_re, IS_REF, IS_ROW_NPAT, ASM_REF, AROW_DPS, ASM_REF, AROW_SHARES),
     # Reserves: stable
-    ws_bs.cell(row=row_rsv, column=col,
-               value=f"={prev_cl}{row_rsv}").number_format = acct_fmt
-
+    row_rsv: "={prev}%d" % (row_rsv,),
     # Total Equity
-    ws_bs.cell(row=row_teq, column=col,
-               value=f"={cl}{row_sc}+{cl}{row_re}+{cl}{row_rsv}").number_format = acct_fmt
-
+    row_teq: "={cl}%d+{cl}%d+{cl}%d" % (row_sc, row_re, row_rsv),
     # Total L&E
-    ws_bs.cell(row=row_tle, column=col,
-               value=f"={cl}{row_tl}+{cl}{row_teq}").number_format = acct_fmt
-
+    row_tle: "={cl}%d+{cl}%d" % (row_tl, row_teq),
     # BS Check
-    ws_bs.cell(row=row_check, column=col,
-               value=f"={cl}{row_ta}-{cl}{row_tle}").number_format = acct_fmt
+    row_check: "={cl}%d-{cl}%d" % (row_ta, row_tle),
+}
 
-    # Shade
-    for rr in range(5, r):
-        mark_forecast_cols(ws_bs, rr, col, col)
-
-set_col_widths(ws_bs, {"A": 40, "B": 10})
-for i in range(HIST_START, MAX_COL + 1):
-    ws_bs.column_dimensions[get_column_letter(i)].width = 15
+for row in statement_rows(ws_bs, bs_items, bs_formulas, bs_templates,
+                          check_label="Balance Sheet Check (Assets - L&E)"):
+    ws_bs.append(row)
 
 # ---------------------------------------------------------------------------
 # 4.  CASH FLOW STATEMENT  (Sheet 4)
 # ---------------------------------------------------------------------------
-ws_cf = wb.create_sheet("Cash Flow Statement")
 ws_cf.sheet_properties.tabColor = "BF8F00"
 
-ws_cf.merge_cells("A1:L1")
-ws_cf["A1"] = "Transurban Group – Cash Flow Statement"
-ws_cf["A1"].font = Font(name="Calibri", bold=True, size=14, color=DARK_BLUE)
-ws_cf.row_dimensions[1].height = 30
+set_col_widths(ws_cf, {"A": 40, "B": 10}, year_width=15)
 
-ws_cf.merge_cells("A2:L2")
-ws_cf["A2"] = "A$ millions  |  Fiscal year ends 30 June"
-ws_cf["A2"].font = Font(name="Calibri", italic=True, size=10, color="666666")
+append_title_rows(ws_cf, "Transurban Group – Cash Flow Statement",
+                  "A$ millions  |  Fiscal year ends 30 June")
 
-r = 4
-ws_cf.cell(row=r, column=LABEL_COL, value="Cash Flow Statement")
-for i, fy in enumerate(FY_LABELS):
-    ws_cf.cell(row=r, column=HIST_START + i, value=fy)
-style_header_row(ws_cf, r, MAX_COL)
+ws_cf.append(style_header_row(ws_cf, "Cash Flow Statement"))
 
 # Historical cash flow data
 hist_cfo_npat = hist_npat  # starting point
 hist_cfo_da = [-x for x in hist_da]  # add back (positive)
 hist_wc_change = [-45, 30, -60, 25, -15]
 hist_other_ops = [120, 135, 150, 160, 170]
-hist_net_cfo = [np + da + wc + oth for np, da, wc, oth in
-                zip(hist_cfo_npat, hist_cfo_da, hist_wc_change, hist_other_ops)]
 
 hist_capex = [-628, -1_092, -1_805, -1_420, -1_200]
 hist_other_inv = [-150, -80, -120, -100, -90]
-hist_net_cfi = [cx + oi for cx, oi in zip(hist_capex, hist_other_inv)]
 
 hist_debt_proc = [1_200, 2_050, 2_800, 600, 300]
 hist_div_paid = [-792, -1_032, -1_218, -1_276, -1_313]
 hist_equity_iss = [405, 450, 430, 340, 290]
-hist_net_cff = [dp + dv + eq for dp, dv, eq in
-                zip(hist_debt_proc, hist_div_paid, hist_equity_iss)]
 
-hist_net_change = [o + i + f for o, i, f in zip(hist_net_cfo, hist_net_cfi, hist_net_cff)]
 # Opening cash = prior year closing cash on BS
-hist_open_cash = [2_285]  # FY21 opening (FY20 closing cash)
-for k in range(4):
-    hist_open_cash.append(hist_cash[k])  # closing cash of prior year = opening of next
+# FY21 opens on FY20 closing cash; each later year opens on the prior close
+hist_open_cash = [2_285, *hist_cash[:4]]
+
+# Derived subtotals, built in a single pass over the five historical years.
 # FX & other = closing cash (BS) - opening cash - net change
-hist_fx_other = [c - oc - nc for c, oc, nc in zip(hist_cash, hist_open_cash, hist_net_change)]
+hist_net_cfo, hist_net_cfi, hist_net_cff = [], [], []
+hist_net_change, hist_fx_other = [], []
+for npat, da, wc, oth, cx, oi, dp, dv, eq, close, opening in zip(
+        hist_cfo_npat, hist_cfo_da, hist_wc_change, hist_other_ops, hist_capex,
+        hist_other_inv, hist_debt_proc, hist_div_paid, hist_equity_iss,
+        hist_cash, hist_open_cash):
+    cfo = npat + da + wc + oth
+    cfi = cx + oi
+    cff = dp + dv + eq
+    net = cfo + cfi + cff
+    hist_net_cfo.append(cfo)
+    hist_net_cfi.append(cfi)
+    hist_net_cff.append(cff)
+    hist_net_change.append(net)
+    hist_fx_other.append(close - opening - net)
 
 cf_items = [
     ("OPERATING ACTIVITIES", None, None, True, False),
@@ -802,31 +846,8 @@ cf_items = [
     ("Closing Cash Balance", "A$m", hist_cash, False, True),
 ]
 
-CF_ROW = {}
-r = 5
-for label, unit, hist, is_section, is_total in cf_items:
-    ws_cf.cell(row=r, column=LABEL_COL, value=label)
-    if unit:
-        ws_cf.cell(row=r, column=UNIT_COL, value=unit)
-    CF_ROW[label] = r
-
-    if is_section:
-        style_section_row(ws_cf, r, MAX_COL)
-    elif is_total:
-        for c in range(1, MAX_COL + 1):
-            ws_cf.cell(row=r, column=c).font = total_font
-            ws_cf.cell(row=r, column=c).border = thick_bottom if label != "Closing Cash Balance" else double_bottom
-
-    if hist is not None:
-        for i, v in enumerate(hist):
-            ws_cf.cell(row=r, column=HIST_START + i, value=v).number_format = acct_fmt
-
-    r += 1
-
-# Verify pre-computed CF row positions match actual
-actual_cf_close_row = CF_ROW["Closing Cash Balance"]
-assert actual_cf_close_row == CF_CLOSE_CASH_ROW, \
-    f"CF close row mismatch: {actual_cf_close_row} != {CF_CLOSE_CASH_ROW}"
+# Verify the pre-computed row positions match the item list (before any writes)
+assert [label for label, *_ in cf_items] == _cf_labels, "CF item list does not match _cf_labels"
 
 # ---- FORECAST FORMULAS FOR CASH FLOW (FY26-FY30) ----
 cf_npat_row = CF_ROW["Net profit / (loss) after tax"]
@@ -846,107 +867,62 @@ cf_fx_row = CF_ROW["FX & other adjustments"]
 cf_open_row = CF_ROW["Opening cash balance"]
 cf_close_row = CF_ROW["Closing Cash Balance"]
 
-for fc_idx in range(5):
-    col = FC_START + fc_idx
-    cl = get_column_letter(col)
-    prev_cl = get_column_letter(col - 1)
-
+cf_templates = {
     # -- OPERATING --
     # NPAT from IS
-    ws_cf.cell(row=cf_npat_row, column=col,
-               value=f"='Income Statement'!{cl}{IS_ROW_NPAT}").number_format = acct_fmt
-
+    cf_npat_row: "=%s{cl}%d" % (IS_REF, IS_ROW_NPAT),
     # D&A add-back (positive) = negative of IS D&A
-    ws_cf.cell(row=cf_da_row, column=col,
-               value=f"=-'Income Statement'!{cl}{IS_ROW_DA}").number_format = acct_fmt
-
+    cf_da_row: "=-%s{cl}%d" % (IS_REF, IS_ROW_DA),
     # Working capital change = -(change in receivables) + (change in payables)
-    ws_cf.cell(row=cf_wc_row, column=col,
-               value=f"=-('Balance Sheet'!{cl}{row_recv}-'Balance Sheet'!{prev_cl}{row_recv})+('Balance Sheet'!{cl}{row_pay}-'Balance Sheet'!{prev_cl}{row_pay})").number_format = acct_fmt
-
+    cf_wc_row: "=-(%s{cl}%d-%s{prev}%d)+(%s{cl}%d-%s{prev}%d)" % (BS_REF, row_recv, BS_REF, row_recv, BS_REF, row_pay, BS_REF, row_pay),
     # Other operating adjustments: held stable
-    ws_cf.cell(row=cf_other_ops_row, column=col,
-               value=f"={prev_cl}{cf_other_ops_row}*1.02").number_format = acct_fmt
-
+    cf_other_ops_row: "={prev}%d*1.02" % (cf_other_ops_row,),
     # Net CFO
-    ws_cf.cell(row=cf_net_ops_row, column=col,
-               value=f"={cl}{cf_npat_row}+{cl}{cf_da_row}+{cl}{cf_wc_row}+{cl}{cf_other_ops_row}").number_format = acct_fmt
-
+    cf_net_ops_row: "={cl}%d+{cl}%d+{cl}%d+{cl}%d" % (cf_npat_row, cf_da_row, cf_wc_row, cf_other_ops_row),
     # -- INVESTING --
     # Capex from assumptions (negative)
-    ws_cf.cell(row=cf_capex_row, column=col,
-               value=f"=-Assumptions!{cl}{AROW_CAPEX}").number_format = acct_fmt
-
+    cf_capex_row: "=-%s{cl}%d" % (ASM_REF, AROW_CAPEX),
     # Other investing: held roughly stable
-    ws_cf.cell(row=cf_other_inv_row, column=col,
-               value=f"={prev_cl}{cf_other_inv_row}").number_format = acct_fmt
-
+    cf_other_inv_row: "={prev}%d" % (cf_other_inv_row,),
     # Net CFI
-    ws_cf.cell(row=cf_net_inv_row, column=col,
-               value=f"={cl}{cf_capex_row}+{cl}{cf_other_inv_row}").number_format = acct_fmt
-
+    cf_net_inv_row: "={cl}%d+{cl}%d" % (cf_capex_row, cf_other_inv_row),
     # -- FINANCING --
     # Debt proceeds/repayment from assumptions
-    ws_cf.cell(row=cf_debt_row, column=col,
-               value=f"=Assumptions!{cl}{AROW_NET_DEBT}").number_format = acct_fmt
-
+    cf_debt_row: "=%s{cl}%d" % (ASM_REF, AROW_NET_DEBT),
     # Dividends paid = -(DPS * shares / 100)
-    ws_cf.cell(row=cf_div_row, column=col,
-               value=f"=-Assumptions!{cl}{AROW_DPS}*Assumptions!{cl}{AROW_SHARES}/100").number_format = acct_fmt
-
+    cf_div_row: "=-%s{cl}%d*%s{cl}%d/100" % (ASM_REF, AROW_DPS, ASM_REF, AROW_SHARES),
     # Equity issuance ≈ prior share capital * 1% DRP
-    ws_cf.cell(row=cf_equity_row, column=col,
-               value=f"='Balance Sheet'!{prev_cl}{row_sc}*0.01").number_format = acct_fmt
-
+    cf_equity_row: "=%s{prev}%d*0.01" % (BS_REF, row_sc),
     # Net CFF
-    ws_cf.cell(row=cf_net_fin_row, column=col,
-               value=f"={cl}{cf_debt_row}+{cl}{cf_div_row}+{cl}{cf_equity_row}").number_format = acct_fmt
-
+    cf_net_fin_row: "={cl}%d+{cl}%d+{cl}%d" % (cf_debt_row, cf_div_row, cf_equity_row),
     # Net change in cash
-    ws_cf.cell(row=cf_net_change_row, column=col,
-               value=f"={cl}{cf_net_ops_row}+{cl}{cf_net_inv_row}+{cl}{cf_net_fin_row}").number_format = acct_fmt
-
-    # FX / other: assume nil in forecast
-    ws_cf.cell(row=cf_fx_row, column=col, value=0).number_format = acct_fmt
-
+    cf_net_change_row: "={cl}%d+{cl}%d+{cl}%d" % (cf_net_ops_row, cf_net_inv_row, cf_net_fin_row),
     # Opening cash = prior period closing cash on BS
-    ws_cf.cell(row=cf_open_row, column=col,
-               value=f"='Balance Sheet'!{prev_cl}{row_cash}").number_format = acct_fmt
-
+    cf_open_row: "=%s{prev}%d" % (BS_REF, row_cash),
     # Closing cash
-    ws_cf.cell(row=cf_close_row, column=col,
-               value=f"={cl}{cf_open_row}+{cl}{cf_net_change_row}+{cl}{cf_fx_row}").number_format = acct_fmt
+    cf_close_row: "={cl}%d+{cl}%d+{cl}%d" % (cf_open_row, cf_net_change_row, cf_fx_row),
+}
 
-    # Shade
-    for rr in range(5, r):
-        mark_forecast_cols(ws_cf, rr, col, col)
+# FX / other: assume nil in forecast
+cf_formulas = {(cf_fx_row, col): 0 for col in range(FC_START, FC_END + 1)}
 
-set_col_widths(ws_cf, {"A": 40, "B": 10})
-for i in range(HIST_START, MAX_COL + 1):
-    ws_cf.column_dimensions[get_column_letter(i)].width = 15
+for row in statement_rows(ws_cf, cf_items, cf_formulas, cf_templates,
+                          check_label="Closing Cash Balance"):
+    ws_cf.append(row)
 
 # ---------------------------------------------------------------------------
 # 5.  NOTES TO THE FINANCIAL STATEMENTS  (Sheet 5)
 # ---------------------------------------------------------------------------
-ws_notes = wb.create_sheet("Notes")
 ws_notes.sheet_properties.tabColor = "7030A0"  # Purple
 
-ws_notes.merge_cells("A1:L1")
-ws_notes["A1"] = "Transurban Group – Notes to the Financial Statements"
-ws_notes["A1"].font = Font(name="Calibri", bold=True, size=14, color=DARK_BLUE)
-ws_notes.row_dimensions[1].height = 30
+# Set column widths
+set_col_widths(ws_notes, {"A": 40, "B": 10}, year_width=15)
 
-ws_notes.merge_cells("A2:L2")
-ws_notes["A2"] = "A$ millions  |  Fiscal year ends 30 June"
-ws_notes["A2"].font = Font(name="Calibri", italic=True, size=10, color="666666")
+append_title_rows(ws_notes, "Transurban Group – Notes to the Financial Statements",
+                  "A$ millions  |  Fiscal year ends 30 June")
 
 # Header row (row 4)
-r = 4
-ws_notes.cell(row=r, column=LABEL_COL, value="Notes")
-ws_notes.cell(row=r, column=UNIT_COL, value="")
-for i, fy in enumerate(FY_LABELS):
-    ws_notes.cell(row=r, column=HIST_START + i, value=fy)
-style_header_row(ws_notes, r, MAX_COL)
+ws_notes.append(style_header_row(ws_notes, "Notes", ""))
 
 # Historical construction revenue data
 hist_construction_rev = [180, 320, 540, 420, 350]
@@ -1069,67 +1045,17 @@ notes_items = [
     ("Contingent liabilities", "A$m", hist_contingent_liab, False, False, False),
 ]
 
-NOTES_ROW = {}
-r = 5
-for label, unit, data, is_section, is_total, is_check in notes_items:
-    ws_notes.cell(row=r, column=LABEL_COL, value=label)
-    if unit:
-        ws_notes.cell(row=r, column=UNIT_COL, value=unit)
-    NOTES_ROW[label] = r
-    
-    if is_section:
-        style_section_row(ws_notes, r, MAX_COL)
-    elif is_total:
-        for c in range(1, MAX_COL + 1):
-            ws_notes.cell(row=r, column=c).font = total_font
-            if is_check:
-                ws_notes.cell(row=r, column=c).border = double_bottom
-            else:
-                ws_notes.cell(row=r, column=c).border = thick_bottom
-    
-    # Write historical values or formulas
-    if data is not None and isinstance(data, list):
-        # Hard-coded historical data
-        for i, v in enumerate(data):
-            col = HIST_START + i
-            cell = ws_notes.cell(row=r, column=col, value=v)
-            if unit == "%":
-                cell.number_format = pct_fmt
-            elif unit in ["A$m", "A¢", "m", "days"]:
-                cell.number_format = acct_fmt if unit == "A$m" else num_fmt
-    
-    r += 1
+# Notes rows, all resolved here in one pass so a mistyped label fails before
+# any formulas are built
+NOTES_ROW = {label: 5 + i for i, (label, *_) in enumerate(notes_items) if label}
 
-# Now add formulas for historical and forecast periods
 # Note 1: Revenue Breakdown
 row_toll = NOTES_ROW["Toll revenue"]
 row_construction = NOTES_ROW["Construction revenue"]
 row_other_rev = NOTES_ROW["Other revenue"]
 row_total_rev_note = NOTES_ROW["Total Revenue"]
 
-for col_idx in range(10):  # FY21-FY30
-    col = HIST_START + col_idx
-    cl = get_column_letter(col)
-    prev_cl = get_column_letter(col - 1)
-    
-    # Toll revenue - link to IS
-    ws_notes.cell(row=row_toll, column=col,
-                  value=f"='Income Statement'!{cl}{IS_ROW['Toll revenue']}").number_format = acct_fmt
-    
-    # Construction revenue - historical hard-coded, forecast grows at 3%
-    if col >= FC_START:
-        ws_notes.cell(row=row_construction, column=col,
-                      value=f"={prev_cl}{row_construction}*1.03").number_format = acct_fmt
-    
-    # Other revenue - link to IS
-    ws_notes.cell(row=row_other_rev, column=col,
-                  value=f"='Income Statement'!{cl}{IS_ROW['Other revenue']}").number_format = acct_fmt
-    
-    # Total Revenue - link to IS
-    ws_notes.cell(row=row_total_rev_note, column=col,
-                  value=f"='Income Statement'!{cl}{IS_ROW['Total Revenue']}").number_format = acct_fmt
-
-# Note 2: Segment Reporting (historical only, no forecast formulas)
+# Note 2: Segment Reporting
 # Calculate segment row positions based on the known structure
 row_melb_rev = NOTES_ROW["Melbourne (CityLink)"] + 1  # Melbourne revenue is one row after the label
 row_melb_ebitda = row_melb_rev + 1
@@ -1143,22 +1069,6 @@ row_total_seg_rev = NOTES_ROW["Total segment revenue"]
 row_total_seg_ebitda = NOTES_ROW["Total segment EBITDA"]
 row_recon_ebitda = NOTES_ROW["Reconciliation to IS EBITDA"]
 
-for col_idx in range(5):  # Historical only FY21-FY25
-    col = HIST_START + col_idx
-    cl = get_column_letter(col)
-    
-    # Total segment revenue = sum of all segment revenues
-    ws_notes.cell(row=row_total_seg_rev, column=col,
-                  value=f"={cl}{row_melb_rev}+{cl}{row_syd_rev}+{cl}{row_bris_rev}+{cl}{row_na_rev}").number_format = acct_fmt
-    
-    # Total segment EBITDA = sum of all segment EBITDAs
-    ws_notes.cell(row=row_total_seg_ebitda, column=col,
-                  value=f"={cl}{row_melb_ebitda}+{cl}{row_syd_ebitda}+{cl}{row_bris_ebitda}+{cl}{row_na_ebitda}").number_format = acct_fmt
-    
-    # Reconciliation to IS EBITDA
-    ws_notes.cell(row=row_recon_ebitda, column=col,
-                  value=f"='Income Statement'!{cl}{IS_ROW['EBITDA']}").number_format = acct_fmt
-
 # Note 3: Intangible Assets
 row_intang_open = NOTES_ROW["Opening balance"]
 row_intang_add = NOTES_ROW["Additions (capitalised construction)"]
@@ -1166,33 +1076,6 @@ row_intang_amort = NOTES_ROW["Amortisation charge"]
 row_intang_close = NOTES_ROW["Closing balance"]
 row_intang_check = NOTES_ROW["Cross-check to BS"]
 
-for col_idx in range(10):  # FY21-FY30
-    col = HIST_START + col_idx
-    cl = get_column_letter(col)
-    prev_cl = get_column_letter(col - 1)
-    
-    # Opening balance - for FY21 use hard-coded, for others use prior year closing
-    if col > HIST_START:
-        ws_notes.cell(row=row_intang_open, column=col,
-                      value=f"={prev_cl}{row_intang_close}").number_format = acct_fmt
-    
-    # Additions - historical hard-coded, forecast links to construction revenue
-    if col >= FC_START:
-        ws_notes.cell(row=row_intang_add, column=col,
-                      value=f"={cl}{row_construction}").number_format = acct_fmt
-    
-    # Amortisation charge - link to IS D&A * 0.60
-    ws_notes.cell(row=row_intang_amort, column=col,
-                  value=f"='Income Statement'!{cl}{IS_ROW['Depreciation & amortisation']}*0.60").number_format = acct_fmt
-    
-    # Closing balance = Opening + Additions + Amortisation (amort is negative)
-    ws_notes.cell(row=row_intang_close, column=col,
-                  value=f"={cl}{row_intang_open}+{cl}{row_intang_add}+{cl}{row_intang_amort}").number_format = acct_fmt
-    
-    # Cross-check to BS
-    ws_notes.cell(row=row_intang_check, column=col,
-                  value=f"='Balance Sheet'!{cl}{BS_ROW['Intangible assets (concessions)']}").number_format = acct_fmt
-
 # Note 4: Borrowings
 row_curr_debt = NOTES_ROW["Current borrowings"]
 row_nc_debt = NOTES_ROW["Non-current borrowings"]
@@ -1206,54 +1089,6 @@ row_interest = NOTES_ROW["  Interest expense"]
 row_cap_costs = NOTES_ROW["  Capitalised borrowing costs"]
 row_eff_rate = NOTES_ROW["  Effective interest rate"]
 
-for col_idx in range(10):  # FY21-FY30
-    col = HIST_START + col_idx
-    cl = get_column_letter(col)
-    
-    # Link to BS borrowings
-    ws_notes.cell(row=row_curr_debt, column=col,
-                  value=f"='Balance Sheet'!{cl}{BS_ROW['Current borrowings']}").number_format = acct_fmt
-    ws_notes.cell(row=row_nc_debt, column=col,
-                  value=f"='Balance Sheet'!{cl}{BS_ROW['Non-current borrowings']}").number_format = acct_fmt
-    ws_notes.cell(row=row_total_debt, column=col,
-                  value=f"='Balance Sheet'!{cl}{BS_ROW['Total Borrowings (current + non-current)']}").number_format = acct_fmt
-    
-    # Maturity profile
-    # Within 1 year = current borrowings
-    ws_notes.cell(row=row_mat_within_1, column=col,
-                  value=f"={cl}{row_curr_debt}").number_format = acct_fmt
-    
-    # 1-2 years - historical hard-coded, forecast = 5% of total
-    if col >= FC_START:
-        ws_notes.cell(row=row_mat_1_2, column=col,
-                      value=f"={cl}{row_total_debt}*0.05").number_format = acct_fmt
-    
-    # 2-5 years - historical hard-coded, forecast = 26% of total
-    if col >= FC_START:
-        ws_notes.cell(row=row_mat_2_5, column=col,
-                      value=f"={cl}{row_total_debt}*0.26").number_format = acct_fmt
-    
-    # Over 5 years = Total - within 1yr - 1-2yr - 2-5yr
-    ws_notes.cell(row=row_mat_over_5, column=col,
-                  value=f"={cl}{row_total_debt}-{cl}{row_mat_within_1}-{cl}{row_mat_1_2}-{cl}{row_mat_2_5}").number_format = acct_fmt
-    
-    # Total maturity check
-    ws_notes.cell(row=row_mat_total, column=col,
-                  value=f"={cl}{row_mat_within_1}+{cl}{row_mat_1_2}+{cl}{row_mat_2_5}+{cl}{row_mat_over_5}").number_format = acct_fmt
-    
-    # Interest expense - link to IS with sign flip
-    ws_notes.cell(row=row_interest, column=col,
-                  value=f"=-'Income Statement'!{cl}{IS_ROW['Net finance costs']}").number_format = acct_fmt
-    
-    # Capitalised borrowing costs - historical hard-coded, forecast formula
-    if col >= FC_START:
-        ws_notes.cell(row=row_cap_costs, column=col,
-                      value=f"=Assumptions!{cl}{AROW_CAPEX}*Assumptions!{cl}{AROW_COD}*0.15").number_format = acct_fmt
-    
-    # Effective interest rate - link to Assumptions
-    ws_notes.cell(row=row_eff_rate, column=col,
-                  value=f"=Assumptions!{cl}{AROW_COD}").number_format = pct_fmt
-
 # Note 5: Income Tax
 row_pbt = NOTES_ROW["Profit before tax"]
 row_tax_30 = NOTES_ROW["Tax at statutory rate (30%)"]
@@ -1265,40 +1100,6 @@ row_tax_exp = NOTES_ROW["Income tax expense"]
 row_etr = NOTES_ROW["Effective tax rate"]
 row_etr_assum = NOTES_ROW["ETR per Assumptions"]
 
-for col_idx in range(10):  # FY21-FY30
-    col = HIST_START + col_idx
-    cl = get_column_letter(col)
-    
-    # PBT - link to IS
-    ws_notes.cell(row=row_pbt, column=col,
-                  value=f"='Income Statement'!{cl}{IS_ROW['Profit / (Loss) before tax']}").number_format = acct_fmt
-    
-    # Tax at 30%
-    ws_notes.cell(row=row_tax_30, column=col,
-                  value=f"={cl}{row_pbt}*-0.30").number_format = acct_fmt
-    
-    # Adjustments - historical hard-coded, forecast holds flat
-    if col >= FC_START:
-        ws_notes.cell(row=row_non_ded, column=col, value=190).number_format = acct_fmt
-        ws_notes.cell(row=row_tax_conc, column=col, value=-40).number_format = acct_fmt
-        ws_notes.cell(row=row_other_perm, column=col, value=8).number_format = acct_fmt
-    
-    # Total tax adjustments
-    ws_notes.cell(row=row_total_adj, column=col,
-                  value=f"={cl}{row_non_ded}+{cl}{row_tax_conc}+{cl}{row_other_perm}").number_format = acct_fmt
-    
-    # Income tax expense - link to IS
-    ws_notes.cell(row=row_tax_exp, column=col,
-                  value=f"='Income Statement'!{cl}{IS_ROW['Income tax (expense) / benefit']}").number_format = acct_fmt
-    
-    # Effective tax rate
-    ws_notes.cell(row=row_etr, column=col,
-                  value=f"={cl}{row_tax_exp}/{cl}{row_pbt}").number_format = pct_fmt
-    
-    # ETR per Assumptions
-    ws_notes.cell(row=row_etr_assum, column=col,
-                  value=f"=Assumptions!{cl}{AROW_TAX}").number_format = pct_fmt
-
 # Note 6: Dividends/Distributions
 row_dps = NOTES_ROW["DPS (cents per security)"]
 row_shares = NOTES_ROW["Securities on issue (m)"]
@@ -1306,75 +1107,187 @@ row_dist_paid = NOTES_ROW["Total distributions paid"]
 row_payout = NOTES_ROW["Payout ratio (% of NPAT)"]
 row_franking = NOTES_ROW["Franking credits"]
 
-for col_idx in range(10):  # FY21-FY30
-    col = HIST_START + col_idx
-    cl = get_column_letter(col)
-    
+# Note 7: Commitments & Contingencies
+row_cap_commit = NOTES_ROW["Capital commitments"]
+row_op_lease = NOTES_ROW["Operating lease commitments"]
+row_contingent = NOTES_ROW["Contingent liabilities"]
+
+# Cross-sheet references the notes link to, built once for every year column
+is_toll_refs = sheet_refs(IS_REF, IS_ROW["Toll revenue"])
+is_other_rev_refs = sheet_refs(IS_REF, IS_ROW["Other revenue"])
+is_trev_refs = sheet_refs(IS_REF, IS_ROW_TREV)
+is_ebitda_refs = sheet_refs(IS_REF, IS_ROW["EBITDA"])
+is_da_refs = sheet_refs(IS_REF, IS_ROW_DA)
+is_nfc_refs = sheet_refs(IS_REF, IS_ROW["Net finance costs"])
+is_pbt_refs = sheet_refs(IS_REF, IS_ROW["Profit / (Loss) before tax"])
+is_tax_refs = sheet_refs(IS_REF, IS_ROW["Income tax (expense) / benefit"])
+is_npat_refs = sheet_refs(IS_REF, IS_ROW_NPAT)
+bs_intang_refs = sheet_refs(BS_REF, BS_ROW["Intangible assets (concessions)"])
+bs_cd_refs = sheet_refs(BS_REF, BS_ROW["Current borrowings"])
+bs_ncd_refs = sheet_refs(BS_REF, BS_ROW["Non-current borrowings"])
+bs_debt_refs = sheet_refs(BS_REF, BS_DEBT_ROW)
+cf_div_refs = sheet_refs(CF_REF, CF_ROW["Dividends / distributions paid"])
+asm_capex_refs = sheet_refs(ASM_REF, AROW_CAPEX)
+asm_cod_refs = sheet_refs(ASM_REF, AROW_COD)
+asm_tax_refs = sheet_refs(ASM_REF, AROW_TAX)
+asm_dps_refs = sheet_refs(ASM_REF, AROW_DPS)
+asm_shares_refs = sheet_refs(ASM_REF, AROW_SHARES)
+
+# Now add formulas for historical and forecast periods.  Each overrides any
+# hard-coded historical figure in the same cell.  All notes share one pass per
+# period range: every year, historical years only, then forecast years only.
+notes_formulas = {}  # (row, col) -> formula
+
+# Column-sum templates, joined once
+seg_rev_sum = sum_template([row_melb_rev, row_syd_rev, row_bris_rev, row_na_rev])
+seg_ebitda_sum = sum_template([row_melb_ebitda, row_syd_ebitda, row_bris_ebitda, row_na_ebitda])
+intang_close_sum = sum_template([row_intang_open, row_intang_add, row_intang_amort])
+mat_total_sum = sum_template([row_mat_within_1, row_mat_1_2, row_mat_2_5, row_mat_over_5])
+tax_adj_sum = sum_template([row_non_ded, row_tax_conc, row_other_perm])
+
+for col, cl, prev_cl in YEAR_COLS:  # FY21-FY30
+    # -- Note 1: Revenue Breakdown --
+    # Toll revenue - link to IS
+    notes_formulas[row_toll, col] = "=" + is_toll_refs[col]
+
+    # Other revenue - link to IS
+    notes_formulas[row_other_rev, col] = "=" + is_other_rev_refs[col]
+
+    # Total Revenue - link to IS
+    notes_formulas[row_total_rev_note, col] = "=" + is_trev_refs[col]
+
+    # -- Note 3: Intangible Assets --
+    # Opening balance - for FY21 use hard-coded, for others use prior year closing
+    if col > HIST_START:
+        notes_formulas[row_intang_open, col] = f"={prev_cl}{row_intang_close}"
+
+    # Amortisation charge - link to IS D&A * 0.60
+    notes_formulas[row_intang_amort, col] = f"={is_da_refs[col]}*0.60"
+
+    # Closing balance = Opening + Additions + Amortisation (amort is negative)
+    notes_formulas[row_intang_close, col] = intang_close_sum.format(cl=cl)
+
+    # Cross-check to BS
+    notes_formulas[row_intang_check, col] = "=" + bs_intang_refs[col]
+
+    # -- Note 4: Borrowings --
+    # Link to BS borrowings
+    notes_formulas[row_curr_debt, col] = "=" + bs_cd_refs[col]
+    notes_formulas[row_nc_debt, col] = "=" + bs_ncd_refs[col]
+    notes_formulas[row_total_debt, col] = "=" + bs_debt_refs[col]
+
+    # Maturity profile
+    # Within 1 year = current borrowings
+    notes_formulas[row_mat_within_1, col] = f"={cl}{row_curr_debt}"
+
+    # Over 5 years = Total - within 1yr - 1-2yr - 2-5yr
+    notes_formulas[row_mat_over_5, col] = f"={cl}{row_total_debt}-{cl}{row_mat_within_1}-{cl}{row_mat_1_2}-{cl}{row_mat_2_5}"
+
+    # Total maturity check
+    notes_formulas[row_mat_total, col] = mat_total_sum.format(cl=cl)
+
+    # Interest expense - link to IS with sign flip
+    notes_formulas[row_interest, col] = f"=-{is_nfc_refs[col]}"
+
+    # Effective interest rate - link to Assumptions
+    notes_formulas[row_eff_rate, col] = "=" + asm_cod_refs[col]
+
+    # -- Note 5: Income Tax --
+    # PBT - link to IS
+    notes_formulas[row_pbt, col] = "=" + is_pbt_refs[col]
+
+    # Tax at 30%
+    notes_formulas[row_tax_30, col] = f"={cl}{row_pbt}*-0.30"
+
+    # Total tax adjustments
+    notes_formulas[row_total_adj, col] = tax_adj_sum.format(cl=cl)
+
+    # Income tax expense - link to IS
+    notes_formulas[row_tax_exp, col] = "=" + is_tax_refs[col]
+
+    # Effective tax rate
+    notes_formulas[row_etr, col] = f"={cl}{row_tax_exp}/{cl}{row_pbt}"
+
+    # ETR per Assumptions
+    notes_formulas[row_etr_assum, col] = "=" + asm_tax_refs[col]
+
+    # -- Note 6: Dividends/Distributions --
     # DPS - link to Assumptions
-    ws_notes.cell(row=row_dps, column=col,
-                  value=f"=Assumptions!{cl}{AROW_DPS}").number_format = num_fmt
-    
+    notes_formulas[row_dps, col] = "=" + asm_dps_refs[col]
+
     # Securities on issue - link to Assumptions
-    ws_notes.cell(row=row_shares, column=col,
-                  value=f"=Assumptions!{cl}{AROW_SHARES}").number_format = num_fmt
-    
+    notes_formulas[row_shares, col] = "=" + asm_shares_refs[col]
+
     # Total distributions paid - link to CF
-    ws_notes.cell(row=row_dist_paid, column=col,
-                  value=f"='Cash Flow Statement'!{cl}{CF_ROW['Dividends / distributions paid']}").number_format = acct_fmt
-    
+    notes_formulas[row_dist_paid, col] = "=" + cf_div_refs[col]
+
     # Payout ratio
-    ws_notes.cell(row=row_payout, column=col,
-                  value=f"=-{cl}{row_dist_paid}/'Income Statement'!{cl}{IS_ROW['Net Profit / (Loss) After Tax']}").number_format = pct_fmt
-    
-    # Franking credits - hold at 0 for forecast
-    if col >= FC_START:
-        ws_notes.cell(row=row_franking, column=col, value=0).number_format = acct_fmt
+    notes_formulas[row_payout, col] = f"=-{cl}{row_dist_paid}/{is_npat_refs[col]}"
 
-# Note 7: Commitments & Contingencies
-row_cap_commit = NOTES_ROW["Capital commitments"]
-row_op_lease = NOTES_ROW["Operating lease commitments"]
-row_contingent = NOTES_ROW["Contingent liabilities"]
+for col, cl, _ in HIST_YEAR_COLS:  # Historical only FY21-FY25
+    # -- Note 2: Segment Reporting (historical only, no forecast formulas) --
+    # Total segment revenue = sum of all segment revenues
+    notes_formulas[row_total_seg_rev, col] = seg_rev_sum.format(cl=cl)
 
-for col_idx in range(10):  # FY21-FY30
-    col = HIST_START + col_idx
-    cl = get_column_letter(col)
-    prev_cl = get_column_letter(col - 1)
-    
-    # Capital commitments - historical hard-coded, forecast links to capex
-    if col >= FC_START:
-        ws_notes.cell(row=row_cap_commit, column=col,
-                      value=f"=Assumptions!{cl}{AROW_CAPEX}*1.2").number_format = acct_fmt
-    
-    # Operating lease commitments - historical hard-coded, forecast grows at 3%
-    if col >= FC_START:
-        ws_notes.cell(row=row_op_lease, column=col,
-                      value=f"={prev_cl}{row_op_lease}*1.03").number_format = acct_fmt
-    
-    # Contingent liabilities - historical hard-coded, forecast holds flat
-    if col >= FC_START:
-        ws_notes.cell(row=row_contingent, column=col, value=170).number_format = acct_fmt
+    # Total segment EBITDA = sum of all segment EBITDAs
+    notes_formulas[row_total_seg_ebitda, col] = seg_ebitda_sum.format(cl=cl)
 
-# Shade forecast columns for all note rows
-for rr in range(5, r):
-    for col in range(FC_START, FC_END + 1):
-        mark_forecast_cols(ws_notes, rr, col, col)
+    # Reconciliation to IS EBITDA
+    notes_formulas[row_recon_ebitda, col] = "=" + is_ebitda_refs[col]
 
-# Set column widths
-set_col_widths(ws_notes, {"A": 40, "B": 10})
-for i in range(HIST_START, MAX_COL + 1):
-    ws_notes.column_dimensions[get_column_letter(i)].width = 15
+# Forecast-only lines (historical figures are hard-coded)
+for col, cl, prev_cl in FC_YEAR_COLS:  # Forecast only FY26-FY30
+    # -- Note 1 --
+    # Construction revenue - historical hard-coded, forecast grows at 3%
+    notes_formulas[row_construction, col] = f"={prev_cl}{row_construction}*1.03"
 
-# ---------------------------------------------------------------------------
-# 6.  FINAL FORMATTING PASS
-# ---------------------------------------------------------------------------
+    # -- Note 3 --
+    # Additions - historical hard-coded, forecast links to construction revenue
+    notes_formulas[row_intang_add, col] = f"={cl}{row_construction}"
 
-# Freeze panes and print settings for each sheet
-for ws in [ws_a, ws_is, ws_bs, ws_cf, ws_notes]:
-    ws.freeze_panes = f"C5"
-    ws.sheet_view.showGridLines = False
+    # -- Note 4 --
+    # 1-2 years - historical hard-coded, forecast = 5% of total
+    notes_formulas[row_mat_1_2, col] = f"={cl}{row_total_debt}*0.05"
+
+    # 2-5 years - historical hard-coded, forecast = 26% of total
+    notes_formulas[row_mat_2_5, col] = f"={cl}{row_total_debt}*0.26"
+
+    # Capitalised borrowing costs - historical hard-coded, forecast formula
+    notes_formulas[row_cap_costs, col] = f"={asm_capex_refs[col]}*{asm_cod_refs[col]}*0.15"
+
+    # -- Note 5 --
+    # Adjustments - historical hard-coded, forecast holds flat
+    notes_formulas[row_non_ded, col] = 190
+    notes_formulas[row_tax_conc, col] = -40
+    notes_formulas[row_other_perm, col] = 8
+
+    # -- Note 6 --
+    # Franking credits - hold at 0 for forecast
+    notes_formulas[row_franking, col] = 0
+
+    # -- Note 7: Commitments & Contingencies --
+    # Capital commitments - historical hard-coded, forecast links to capex
+    notes_formulas[row_cap_commit, col] = f"={asm_capex_refs[col]}*1.2"
+
+    # Operating lease commitments - historical hard-coded, forecast grows at 3%
+    notes_formulas[row_op_lease, col] = f"={prev_cl}{row_op_lease}*1.03"
+
+    # Contingent liabilities - historical hard-coded, forecast holds flat
+    notes_formulas[row_contingent, col] = 170
+
+# Stream the notes top to bottom, one finished row at a time
+for r, (label, unit, data, is_section, is_total, is_check) in enumerate(notes_items, 5):
+    if is_section:
+        ws_notes.append(style_section_row(ws_notes, label, unit))
+    else:
+        # Hard-coded historical data where given; otherwise formulas only
+        hist = data if isinstance(data, list) else None
+        ws_notes.append(item_row(ws_notes, r, label, unit, hist, notes_formulas, is_total,
+                                 total_style="CheckStyle" if is_check else "TotalStyle",
+                                 number_format=UNIT_FORMATS.get(unit, num_fmt)))
 
 # ---------------------------------------------------------------------------
-# 7.  SAVE
+# 6.  SAVE
 # ---------------------------------------------------------------------------
 OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                            "Transurban_Group_3Way_Financial_Model.xlsx")